@@ -4,13 +4,98 @@ Fleep API Client
 Handles authentication and API requests to the Fleep.io service.
 """
 
+import asyncio
+import json
+import logging
 import os
+import random
+import tempfile
+import time
+from dataclasses import dataclass
+from email.utils import parsedate_to_datetime
+from pathlib import Path
 from typing import Any, Dict, List, Optional
 import httpx
+import orjson
 from dotenv import load_dotenv
 
-# Load environment variables
-load_dotenv()
+logger = logging.getLogger(__name__)
+
+# Overrides where the session token and ticket are persisted when
+# FLEEP_SESSION_CACHE=1; by default they go under the user's cache directory
+SESSION_CACHE_PATH: Optional[Path] = None
+
+# Values never written to the logs
+_SECRET_KEYS = frozenset({"ticket", "token_id", "password"})
+
+# Transient statuses retried with exponential backoff (seconds); the server
+# rejected these before acting on the request, so any request may be resent
+RETRYABLE_STATUS_CODES = frozenset({429, 503})
+# Gateway errors may arrive after Fleep applied the request, so only reads retry them
+RETRYABLE_READ_STATUS_CODES = frozenset({502, 504})
+MAX_RETRIES = 5
+RETRY_BACKOFF_BASE = 0.5
+RETRY_BACKOFF_CAP = 30.0
+# Total time one request may spend waiting between retries
+RETRY_WAIT_BUDGET = 60.0
+
+# Patched by the tests so retries don't actually wait
+_sleep = asyncio.sleep
+
+
+@dataclass(frozen=True)
+class _FleepConfig:
+    """Fleep settings read from the environment."""
+    email: Optional[str]
+    password: Optional[str]
+    session_cache: bool
+
+
+def _load_fleep_config() -> _FleepConfig:
+    """Load environment variables (including .env) once and return the Fleep settings."""
+    load_dotenv()
+    return _FleepConfig(
+        email=os.getenv("FLEEP_EMAIL"),
+        password=os.getenv("FLEEP_PASSWORD"),
+        session_cache=os.getenv("FLEEP_SESSION_CACHE") == "1"
+    )
+
+
+# Read once at import; missing credentials are reported when a client is created
+_CONFIG = _load_fleep_config()
+
+# Process-wide instance returned by FleepClient.shared()
+_shared_client: Optional["FleepClient"] = None
+
+
+def _session_cache_path() -> Optional[Path]:
+    """
+    Return where the session cache lives, or None when there is no home to put it in.
+    
+    Resolved on use rather than at import, so the server still starts in
+    environments without HOME or a passwd entry for the user.
+    """
+    if SESSION_CACHE_PATH is not None:
+        return SESSION_CACHE_PATH
+    
+    # XDG requires an absolute path, relative values are ignored
+    cache_home = os.environ.get("XDG_CACHE_HOME")
+    if cache_home and os.path.isabs(cache_home):
+        base = Path(cache_home)
+    else:
+        try:
+            base = Path.home() / ".cache"
+        except RuntimeError:
+            return None
+    return base / "fleep-mcp" / "session.json"
+
+
+def _redact(values: Any) -> Dict[str, Any]:
+    """Return a shallow copy of a mapping with secret values masked for logging."""
+    return {
+        key: "***" if key in _SECRET_KEYS else value
+        for key, value in dict(values).items()
+    }
 
 
 class FleepAuthenticationError(Exception):
@@ -30,34 +115,174 @@ class FleepClient:
         self.base_url = base_url
         self.session_token: Optional[str] = None
         self.ticket: Optional[str] = None
-        self._client = httpx.AsyncClient()
+        
+        # Serializes logins so concurrent requests that need a session share one
+        self._auth_lock = asyncio.Lock()
+        
+        # Created on first use, see _ensure_client
+        self._client: Optional[httpx.AsyncClient] = None
         
         # Get credentials from environment variables
-        self.email = os.getenv("FLEEP_EMAIL")
-        self.password = os.getenv("FLEEP_PASSWORD")
+        self.email = _CONFIG.email
+        self.password = _CONFIG.password
         
         if not self.email or not self.password:
             raise FleepAuthenticationError(
                 "FLEEP_EMAIL and FLEEP_PASSWORD environment variables must be set"
             )
+        
+        # Reuse a session from a previous run instead of logging in again
+        self.session_cache_enabled = _CONFIG.session_cache
+        if self.session_cache_enabled:
+            self._load_cached_session()
+    
+    @classmethod
+    def shared(cls) -> "FleepClient":
+        """Return the process-wide client, creating it on first use."""
+        global _shared_client
+        if _shared_client is None:
+            _shared_client = cls()
+        return _shared_client
+    
+    async def _ensure_client(self) -> httpx.AsyncClient:
+        """Return the HTTP client, creating it inside the running event loop on first use."""
+        # Nothing here awaits, so concurrent callers can't both see None
+        if self._client is None:
+            # Keep idle connections alive between bursts of tool calls so we
+            # don't pay a fresh TLS handshake for every request
+            limits = httpx.Limits(
+                max_connections=256,
+                max_keepalive_connections=32,
+                keepalive_expiry=60.0
+            )
+            timeout = httpx.Timeout(connect=5.0, read=30.0, write=15.0, pool=5.0)
+            # No explicit transport, so httpx keeps honoring HTTP(S)_PROXY and NO_PROXY
+            self._client = httpx.AsyncClient(
+                base_url=self.base_url,
+                limits=limits,
+                timeout=timeout,
+                http2=True
+            )
+            self._store_session_cookie()
+        return self._client
+    
+    def _load_cached_session(self) -> None:
+        """Restore session token and ticket from the on-disk cache, if present."""
+        cache_path = _session_cache_path()
+        if cache_path is None:
+            return
+        
+        try:
+            with open(cache_path, "r", encoding="utf-8") as f:
+                cached = json.load(f)
+        except (OSError, ValueError):
+            return
+        
+        # Never reuse a session that belongs to a different account
+        if not isinstance(cached, dict) or cached.get("email") != self.email:
+            return
+        
+        if cached.get("token_id") and cached.get("ticket"):
+            self.session_token = cached["token_id"]
+            self.ticket = cached["ticket"]
+            self._store_session_cookie()
+    
+    def _store_session_cookie(self) -> None:
+        """Keep the session token in the client's cookie jar so every request sends it."""
+        if self._client is None:
+            return
+        
+        # Fleep scopes the login cookie to /api/account, replace it with one for the whole API
+        self._client.cookies.delete("token_id")
+        if self.session_token:
+            # No domain, so the cookie also matches dotless hosts such as localhost
+            self._client.cookies.set("token_id", self.session_token)
+    
+    def _save_cached_session(self) -> None:
+        """Atomically persist the current session token and ticket to disk."""
+        cache_path = _session_cache_path()
+        if cache_path is None:
+            return
+        
+        cached = {
+            "email": self.email,
+            "token_id": self.session_token,
+            "ticket": self.ticket,
+            "ts": time.time()
+        }
+        
+        try:
+            cache_path.parent.mkdir(mode=0o700, parents=True, exist_ok=True)
+            # mkstemp creates the file with 0600 permissions
+            fd, tmp_path = tempfile.mkstemp(dir=cache_path.parent, suffix=".tmp")
+            try:
+                with os.fdopen(fd, "w", encoding="utf-8") as f:
+                    json.dump(cached, f)
+                os.replace(tmp_path, cache_path)
+            except BaseException:
+                os.unlink(tmp_path)
+                raise
+        except OSError:
+            # Caching is an optimization only, a failed write must not break login
+            pass
+    
+    def _clear_cached_session(self) -> None:
+        """Remove the on-disk session cache."""
+        cache_path = _session_cache_path()
+        if cache_path is None:
+            return
+        
+        try:
+            cache_path.unlink()
+        except OSError:
+            pass
+    
+    def _invalidate_session(self, rejected_token: Optional[str]) -> None:
+        """Forget the session if it is still the one the API rejected."""
+        # Another request may already have logged in again while ours was in flight
+        if self.session_token != rejected_token:
+            return
+        
+        self.session_token = None
+        self.ticket = None
+        if self._client is not None:
+            self._client.cookies.delete("token_id")
+        if self.session_cache_enabled:
+            self._clear_cached_session()
     
     async def authenticate(self) -> None:
-        """Authenticate with the Fleep API and obtain a session token."""
-        auth_url = f"{self.base_url}/account/login"
+        """
+        Authenticate with the Fleep API and obtain a session token.
         
+        Does nothing if a session is already established; callers waiting on a
+        login that is in progress reuse its result instead of logging in again.
+        """
+        async with self._auth_lock:
+            if self.session_token and self.ticket:
+                return
+            await self._login()
+    
+    async def _login(self) -> None:
+        """Log in to the Fleep API and store the session token and ticket."""
         auth_data = {
             "email": self.email,
             "password": self.password
         }
         
+        client = await self._ensure_client()
+        
         try:
-            response = await self._client.post(auth_url, json=auth_data)
+            response = await client.post("account/login", json=auth_data)
             response.raise_for_status()
             
             # Get token from cookies and ticket from JSON response
-            result = response.json()
-            print(f"Login response cookies: {response.cookies}")
-            print(f"Login response JSON: {result}")
+            result = orjson.loads(response.content)
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug(
+                    "Login response cookies: %s, JSON: %s",
+                    _redact(response.cookies),
+                    _redact(result)
+                )
             
             # Extract token_id from cookies
             if "token_id" in response.cookies:
@@ -70,74 +295,141 @@ class FleepClient:
                 self.ticket = result["ticket"]
             else:
                 raise FleepAuthenticationError(f"No ticket received in authentication response: {result}")
+            
+            # Send session token as 'token_id' cookie on every request as required by Fleep API
+            self._store_session_cookie()
+            
+            if self.session_cache_enabled:
+                self._save_cached_session()
                 
         except httpx.HTTPError as e:
             raise FleepAuthenticationError(f"Authentication failed: {str(e)}")
     
+    async def _do_request(
+        self,
+        method: str,
+        endpoint: str,
+        data: Dict[str, Any],
+        max_bytes: Optional[int] = None
+    ) -> Dict[str, Any]:
+        """Send a single request using the current session token and ticket."""
+        # Embed ticket in JSON data as required by Fleep API
+        if self.ticket:
+            data["ticket"] = self.ticket
+        
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug(
+                "Making %s request to %s with data: %s",
+                method,
+                endpoint,
+                _redact(data)
+            )
+        client = await self._ensure_client()
+        
+        if max_bytes is None:
+            response = await client.request(method=method, url=endpoint, json=data)
+            response.raise_for_status()
+            return orjson.loads(response.content)
+        
+        # Stream the body so an oversized response is abandoned before it is fully read
+        async with client.stream(method, endpoint, json=data) as response:
+            response.raise_for_status()
+            
+            content_length = response.headers.get("Content-Length", "")
+            if content_length.isdigit() and int(content_length) > max_bytes:
+                raise FleepAPIError(f"Response too large: {content_length} bytes exceeds {max_bytes}")
+            
+            body = bytearray()
+            async for chunk in response.aiter_bytes():
+                body += chunk
+                if len(body) > max_bytes:
+                    raise FleepAPIError(f"Response too large: exceeds {max_bytes} bytes")
+        
+        return orjson.loads(body)
+    
+    def _retry_delay(self, response: httpx.Response, attempt: int) -> float:
+        """Return how long to wait before retrying a throttled or failed request."""
+        if response.status_code == 429:
+            retry_after = response.headers.get("Retry-After")
+            if retry_after:
+                try:
+                    return max(0.0, float(retry_after))
+                except ValueError:
+                    pass
+                try:
+                    retry_at = parsedate_to_datetime(retry_after)
+                    return max(0.0, retry_at.timestamp() - time.time())
+                except (TypeError, ValueError):
+                    pass
+        
+        # Exponential backoff with jitter so concurrent callers don't retry in lockstep
+        return min(
+            RETRY_BACKOFF_CAP,
+            RETRY_BACKOFF_BASE * 2 ** attempt + random.uniform(0, RETRY_BACKOFF_BASE)
+        )
+    
     async def _make_request(
         self, 
         method: str, 
         endpoint: str, 
-        data: Optional[Dict[str, Any]] = None
+        data: Optional[Dict[str, Any]] = None,
+        max_bytes: Optional[int] = None,
+        idempotent: bool = False
     ) -> Dict[str, Any]:
-        """Make an authenticated request to the Fleep API."""
+        """
+        Make an authenticated request to the Fleep API.
+        
+        Re-authenticates once on 401 and retries 429/503 responses with
+        backoff, honoring Retry-After when Fleep provides it. 502/504 are
+        retried only when idempotent is set, because a write may already
+        have been applied behind a failing gateway. Gives up with
+        FleepAPIError instead of waiting when Retry-After asks for more than
+        RETRY_BACKOFF_CAP seconds, or when the next wait would take the
+        request past RETRY_WAIT_BUDGET seconds of waiting in total. When
+        max_bytes is given, responses with a larger body raise FleepAPIError.
+        """
         if not self.session_token or not self.ticket:
             await self.authenticate()
         
-        url = f"{self.base_url}/{endpoint.lstrip('/')}"
-        headers = {
-            "Content-Type": "application/json"
-        }
-        
-        # Send session token as 'token_id' in cookies as required by Fleep API
-        cookies = {}
-        if self.session_token:
-            cookies["token_id"] = self.session_token
-        
-        # Embed ticket in JSON data as required by Fleep API
+        # httpx joins the endpoint onto base_url itself, with or without a leading slash
         if data is None:
             data = {}
-        if self.ticket:
-            data["ticket"] = self.ticket
         
-        print(f"Making {method} request to {url} with data: {data} and cookies: {cookies}")
-        try:
-            response = await self._client.request(
-                method=method,
-                url=url,
-                json=data,
-                headers=headers,
-                cookies=cookies
-            )
-            response.raise_for_status()
-            return response.json()
+        reauthenticated = False
+        attempt = 0
+        waited = 0.0
+        while True:
+            sent_token = self.session_token
+            try:
+                return await self._do_request(method, endpoint, data, max_bytes)
             
-        except httpx.HTTPError as e:
-            if response.status_code == 401:
-                # Token might have expired, try to re-authenticate
-                self.session_token = None
-                self.ticket = None
-                await self.authenticate()
-                # Retry the request with refreshed token and ticket
-                cookies = {}
-                if self.session_token:
-                    cookies["token_id"] = self.session_token
+            except httpx.HTTPStatusError as e:
+                status_code = e.response.status_code
+                
+                if status_code == 401 and not reauthenticated:
+                    # Token might have expired, re-authenticate and retry once
+                    reauthenticated = True
+                    self._invalidate_session(sent_token)
+                    await self.authenticate()
+                    continue
                 
-                # Re-embed ticket in JSON data for retry
-                if self.ticket:
-                    data["ticket"] = self.ticket
-                    
-                response = await self._client.request(
-                    method=method,
-                    url=url,
-                    json=data,
-                    headers=headers,
-                    cookies=cookies
+                retryable = status_code in RETRYABLE_STATUS_CODES or (
+                    idempotent and status_code in RETRYABLE_READ_STATUS_CODES
                 )
-                response.raise_for_status()
-                return response.json()
-            else:
+                if retryable and attempt < MAX_RETRIES:
+                    delay = self._retry_delay(e.response, attempt)
+                    # Retrying before the server asked would only be throttled again
+                    if delay <= RETRY_BACKOFF_CAP and waited + delay <= RETRY_WAIT_BUDGET:
+                        attempt += 1
+                        waited += delay
+                        await _sleep(delay)
+                        continue
+                
                 raise FleepAPIError(f"API request failed: {str(e)}")
+            
+            except httpx.HTTPError as e:
+                raise FleepAPIError(f"API request failed: {str(e)}")
+    
     async def create_conversation(
         self,
         topic: Optional[str] = None,
@@ -200,7 +492,8 @@ class FleepClient:
     async def get_conversation_info(
         self,
         conversation_id: str,
-        detail_level: str = "ic_header"
+        detail_level: str = "ic_header",
+        max_bytes: Optional[int] = None
     ) -> Dict[str, Any]:
         """
         Get conversation information including labels.
@@ -208,13 +501,20 @@ class FleepClient:
         Args:
             conversation_id: The ID of the conversation
             detail_level: Level of detail (ic_header, ic_tiny, ic_full)
+            max_bytes: Optional limit on the response body size
             
         Returns:
             Dictionary containing the conversation info with labels
         """
         data = {"mk_direction": detail_level}
         
-        return await self._make_request("POST", f"conversation/sync/{conversation_id}", data)
+        return await self._make_request(
+            "POST",
+            f"conversation/sync/{conversation_id}",
+            data,
+            max_bytes=max_bytes,
+            idempotent=True
+        )
 
     async def set_conversation_labels(
         self,
@@ -239,5 +539,7 @@ class FleepClient:
         return await self._make_request("POST", f"conversation/store/{conversation_id}", data)
     
     async def close(self) -> None:
-        """Close the HTTP client."""
-        await self._client.aclose()
+        """Close the HTTP client; a later request opens a new one."""
+        if self._client is not None:
+            await self._client.aclose()
+            self._client = None
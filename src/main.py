@@ -6,8 +6,14 @@ An MCP server that provides tools for interacting with the Fleep.io API.
 """
 
 import asyncio
+import functools
 import logging
-from typing import Any, Dict, List, Optional
+import logging.handlers
+import queue
+import sys
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Tuple
+
+import orjson
 
 from mcp.server import Server
 from mcp.server.models import InitializationOptions
@@ -19,33 +25,97 @@ from .tools.create_conversation import CreateConversationTool
 from .tools.send_message import SendMessageTool
 from .tools.get_conversation_labels import GetConversationLabelsTool
 from .tools.set_conversation_labels import SetConversationLabelsTool
+from .tools.batch import BatchTool
+
+
+def _configure_logging() -> Tuple[logging.Handler, logging.handlers.QueueListener]:
+    """
+    Route log records through a queue so the event loop never blocks on stderr.
+    
+    Installs the queue handler on the root logger and starts the listener;
+    undo both with _shutdown_logging.
+    
+    Returns:
+        The installed queue handler and the listener that formats and writes
+        queued records on a background thread
+    """
+    log_queue: "queue.SimpleQueue[logging.LogRecord]" = queue.SimpleQueue()
+    
+    stream_handler = logging.StreamHandler(sys.stderr)
+    stream_handler.setFormatter(logging.Formatter(logging.BASIC_FORMAT))
+    
+    queue_handler = logging.handlers.QueueHandler(log_queue)
+    root_logger = logging.getLogger()
+    root_logger.setLevel(logging.INFO)
+    root_logger.addHandler(queue_handler)
+    
+    listener = logging.handlers.QueueListener(log_queue, stream_handler)
+    listener.start()
+    return queue_handler, listener
+
+
+def _shutdown_logging(queue_handler: logging.Handler, listener: logging.handlers.QueueListener) -> None:
+    """Detach the queue handler and flush queued records."""
+    logging.getLogger().removeHandler(queue_handler)
+    listener.stop()
+
 
-# Configure logging
-logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
 # Initialize the MCP server
 server = Server("fleep-mcp")
 
-# Initialize Fleep client
-fleep_client = FleepClient()
 
-# Initialize tools
-create_conversation_tool = CreateConversationTool(fleep_client)
-send_message_tool = SendMessageTool(fleep_client)
-get_conversation_labels_tool = GetConversationLabelsTool(fleep_client)
-set_conversation_labels_tool = SetConversationLabelsTool(fleep_client)
+def get_client() -> FleepClient:
+    """Return the shared Fleep client, creating it on first use."""
+    return FleepClient.shared()
+
+
+@functools.lru_cache(maxsize=None)
+def _tools() -> Dict[str, Any]:
+    """Instantiate the tools once, keyed by tool name."""
+    fleep_client = get_client()
+    tools = (
+        CreateConversationTool(fleep_client),
+        SendMessageTool(fleep_client),
+        GetConversationLabelsTool(fleep_client),
+        SetConversationLabelsTool(fleep_client),
+    )
+    registry = {tool.get_tool_definition()["name"]: tool for tool in tools}
+    
+    # Batches fan out to the other tools only, so they can't nest
+    batch_tool = BatchTool({name: tool.execute for name, tool in registry.items()})
+    registry[batch_tool.get_tool_definition()["name"]] = batch_tool
+    return registry
+
+
+@functools.lru_cache(maxsize=None)
+def _tool_defs() -> List[Dict[str, Any]]:
+    """Return the tools/list response; tool definitions are static so it is built once."""
+    return [tool.get_tool_definition() for tool in _tools().values()]
+
+
+@functools.lru_cache(maxsize=None)
+def _dispatch() -> Dict[str, Callable[[Dict[str, Any]], Awaitable[Dict[str, Any]]]]:
+    """Map tool names to their executors so dispatch is a single lookup."""
+    return {name: tool.execute for name, tool in _tools().items()}
+
+
+def _encode(result: Any) -> str:
+    """Encode a tool result as compact JSON text."""
+    # default=str covers values orjson can't encode natively
+    return orjson.dumps(result, default=str, option=orjson.OPT_NON_STR_KEYS).decode()
+
+
+def _error_content(error: Exception) -> List[TextContent]:
+    """Build the tool response returned when execution raises."""
+    return [TextContent(type="text", text=f"Error: {str(error)}")]
 
 
 @server.list_tools()
 async def handle_list_tools() -> List[Tool]:
     """Return the list of available tools."""
-    return [
-        create_conversation_tool.get_tool_definition(),
-        send_message_tool.get_tool_definition(),
-        get_conversation_labels_tool.get_tool_definition(),
-        set_conversation_labels_tool.get_tool_definition(),
-    ]
+    return _tool_defs()
 
 
 @server.call_tool()
@@ -57,42 +127,42 @@ async def handle_call_tool(
         arguments = {}
     
     try:
-        if name == "create_conversation":
-            result = await create_conversation_tool.execute(arguments)
-            return [TextContent(type="text", text=str(result))]
-        elif name == "send_message":
-            result = await send_message_tool.execute(arguments)
-            return [TextContent(type="text", text=str(result))]
-        elif name == "get_conversation_labels":
-            result = await get_conversation_labels_tool.execute(arguments)
-            return [TextContent(type="text", text=str(result))]
-        elif name == "set_conversation_labels":
-            result = await set_conversation_labels_tool.execute(arguments)
-            return [TextContent(type="text", text=str(result))]
-        else:
+        execute = _dispatch().get(name)
+        if execute is None:
             raise ValueError(f"Unknown tool: {name}")
+        result = await execute(arguments)
+        return [TextContent(type="text", text=_encode(result))]
     except Exception as e:
         logger.error(f"Error executing tool {name}: {e}")
-        return [TextContent(type="text", text=f"Error: {str(e)}")]
+        return _error_content(e)
 
 
 async def main() -> None:
     """Main entry point for the MCP server."""
-    logger.info("Starting Fleep MCP Server...")
-    
-    # Run the server using stdio transport
-    async with stdio_server() as (read_stream, write_stream):
-        await server.run(
-            read_stream,
-            write_stream,
-            InitializationOptions(
-                server_name="fleep-mcp",
-                server_version="0.1.0",
-                capabilities=ServerCapabilities(
-                    tools={"listChanged": True}
+    # Configured here rather than at import so importing this module has no side effects
+    queue_handler, log_listener = _configure_logging()
+    try:
+        logger.info("Starting Fleep MCP Server...")
+        
+        # Fail fast on missing credentials instead of on the first tool call
+        get_client()
+        
+        # Run the server using stdio transport
+        async with stdio_server() as (read_stream, write_stream):
+            await server.run(
+                read_stream,
+                write_stream,
+                InitializationOptions(
+                    server_name="fleep-mcp",
+                    server_version="0.1.0",
+                    capabilities=ServerCapabilities(
+                        tools={"listChanged": True}
+                    ),
                 ),
-            ),
-        )
+            )
+    finally:
+        # Flush queued records before exiting
+        _shutdown_logging(queue_handler, log_listener)
 
 if __name__ == "__main__":
     asyncio.run(main())
@@ -0,0 +1,130 @@
+"""
+Tool Response Cache
+
+Small in-memory LRU cache with per-entry expiry, shared by tools that read
+rarely changing data from the Fleep API.
+"""
+
+import asyncio
+import time
+from collections import OrderedDict
+from typing import Any, Awaitable, Callable, Dict, Hashable, Optional, Tuple
+
+_MISSING = object()
+
+
+class TTLCache:
+    """LRU cache whose entries expire after a time-to-live."""
+
+    def __init__(self, ttl: float = 30.0, maxsize: int = 256):
+        self.ttl = ttl
+        self.maxsize = maxsize
+        self._entries: "OrderedDict[Hashable, Tuple[float, Any]]" = OrderedDict()
+        self._locks: Dict[Hashable, asyncio.Lock] = {}
+
+        # Invalidations are numbered so a factory started before one never caches its result
+        self._version = 0
+        self._invalidated: Dict[Hashable, int] = {}
+        self._cleared_at = 0
+        self._in_flight = 0
+
+    def get(self, key: Hashable, default: Any = None) -> Any:
+        """Return the cached value for key, or default if missing or expired."""
+        entry = self._entries.get(key)
+        if entry is None:
+            return default
+
+        expires_at, value = entry
+        if expires_at <= time.monotonic():
+            del self._entries[key]
+            return default
+
+        self._entries.move_to_end(key)
+        return value
+
+    def set(self, key: Hashable, value: Any, ttl: Optional[float] = None) -> None:
+        """Store value under key, evicting the least recently used entry if full."""
+        expires_at = time.monotonic() + (self.ttl if ttl is None else ttl)
+        self._entries[key] = (expires_at, value)
+        self._entries.move_to_end(key)
+
+        while len(self._entries) > self.maxsize:
+            self._entries.popitem(last=False)
+
+    def invalidate(self, key: Hashable) -> None:
+        """Drop the entry for key, if any, including one still being computed."""
+        self._entries.pop(key, None)
+        if self._in_flight:
+            self._version += 1
+            self._invalidated[key] = self._version
+
+    def clear(self) -> None:
+        """Drop all entries, including ones still being computed."""
+        self._entries.clear()
+        if self._in_flight:
+            self._version += 1
+            self._cleared_at = self._version
+
+    async def get_or_set(
+        self,
+        key: Hashable,
+        factory: Callable[[], Awaitable[Any]],
+        ttl: Optional[float] = None
+    ) -> Any:
+        """
+        Return the cached value for key, computing it with factory on a miss.
+
+        Concurrent misses for the same key are coalesced so that only one
+        factory call is in flight; the others wait and read its result.
+        Exceptions raised by factory are propagated and never cached. If key
+        is invalidated while factory runs, its result is returned to this
+        caller but not cached, so later reads fetch a fresh value.
+
+        Args:
+            key: Cache key
+            factory: Zero-argument callable returning an awaitable of the value
+            ttl: Optional time-to-live overriding the cache default
+
+        Returns:
+            The cached or freshly computed value
+        """
+        value = self.get(key, _MISSING)
+        if value is not _MISSING:
+            return value
+
+        lock = self._locks.setdefault(key, asyncio.Lock())
+        async with lock:
+            # Another coroutine may have filled the entry while we waited
+            value = self.get(key, _MISSING)
+            if value is not _MISSING:
+                return value
+
+            started_at = self._version
+            self._in_flight += 1
+            try:
+                value = await factory()
+                if self._invalidated.get(key, 0) <= started_at and self._cleared_at <= started_at:
+                    self.set(key, value, ttl)
+            finally:
+                self._in_flight -= 1
+                if not self._in_flight:
+                    # No factory predates these invalidations any more
+                    self._invalidated.clear()
+                if self._locks.get(key) is lock:
+                    del self._locks[key]
+
+            return value
+
+
+def conversation_info_key(
+    account: Optional[str],
+    conversation_id: str,
+    detail_level: str = "ic_header"
+) -> Tuple[Optional[str], str, str]:
+    """Return the cache key for a conversation info response seen by account."""
+    return (account, conversation_id, detail_level)
+
+
+# Conversation info shared between the label tools so writes invalidate reads;
+# keys include the account so clients for different users never share entries
+conversation_info_cache = TTLCache()
@@ -0,0 +1,129 @@
+"""
+Batch Tool
+
+Implements the batch MCP tool for running several tool calls concurrently.
+"""
+
+import asyncio
+from typing import Any, Awaitable, Callable, Dict, List
+from pydantic import BaseModel, Field, TypeAdapter, ValidationError
+
+# Every call fans out to Fleep at once, so keep one batch from flooding the API
+MAX_BATCH_CALLS = 20
+
+class BatchCall(BaseModel):
+    """A single tool call inside a batch."""
+    name: str = Field(description="Name of the tool to call")
+    arguments: Dict[str, Any] = Field(
+        default_factory=dict,
+        description="Arguments for the tool"
+    )
+
+class BatchRequest(BaseModel):
+    """Request model for running a batch of tool calls."""
+    calls: List[BatchCall] = Field(
+        max_length=MAX_BATCH_CALLS,
+        description="Tool calls to execute concurrently"
+    )
+
+_ADAPTER = TypeAdapter(BatchRequest)
+
+class BatchTool:
+    """Tool for executing several independent tool calls concurrently."""
+    
+    _TOOL_DEF = {
+        "name": "batch",
+        "description": "Run several independent tool calls concurrently and return their results in order",
+        "inputSchema": {
+            "type": "object",
+            "properties": {
+                "calls": {
+                    "type": "array",
+                    "items": {
+                        "type": "object",
+                        "properties": {
+                            "name": {
+                                "type": "string",
+                                "description": "Name of the tool to call"
+                            },
+                            "arguments": {
+                                "type": "object",
+                                "description": "Arguments for the tool"
+                            }
+                        },
+                        "required": ["name"]
+                    },
+                    "maxItems": MAX_BATCH_CALLS,
+                    "description": "Tool calls to execute concurrently"
+                }
+            },
+            "required": ["calls"]
+        }
+    }
+    
+    def __init__(self, executors: Dict[str, Callable[[Dict[str, Any]], Awaitable[Dict[str, Any]]]]):
+        self.executors = executors
+    
+    @classmethod
+    def get_tool_definition(cls) -> Dict[str, Any]:
+        """Return the MCP tool definition."""
+        return cls._TOOL_DEF
+    
+    async def _run_call(self, call: BatchCall) -> Dict[str, Any]:
+        """Execute one call of the batch."""
+        execute = self.executors.get(call.name)
+        if execute is None:
+            return {
+                "success": False,
+                "error": "Unknown tool",
+                "details": f"Unknown tool: {call.name}"
+            }
+        return await execute(call.arguments)
+    
+    async def execute(self, arguments: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Execute the batch tool.
+        
+        Args:
+            arguments: Tool arguments containing the list of calls
+        
+        Returns:
+            Dictionary containing one result per call, in request order
+        
+        Raises:
+            ValidationError: If the arguments are invalid
+        """
+        try:
+            # Validate input arguments
+            request = _ADAPTER.validate_python(arguments)
+            
+            # Independent calls run concurrently over the shared HTTP/2 connection
+            outcomes = await asyncio.gather(
+                *(self._run_call(call) for call in request.calls),
+                return_exceptions=True
+            )
+            
+            results = []
+            for call, outcome in zip(request.calls, outcomes):
+                # BaseException also covers a cancelled call, which gather returns too
+                if isinstance(outcome, BaseException):
+                    outcome = {
+                        "success": False,
+                        "error": f"Failed to execute {call.name}",
+                        "details": str(outcome) or type(outcome).__name__
+                    }
+                results.append({"name": call.name, **outcome})
+            
+            failed_count = sum(1 for result in results if not result.get("success"))
+            return {
+                "success": True,
+                "results": results,
+                "message": f"Executed {len(results)} call(s), {failed_count} failed"
+            }
+        
+        except ValidationError as e:
+            return {
+                "success": False,
+                "error": "Invalid arguments",
+                "details": str(e)
+            }
@@ -6,7 +6,7 @@ Implements the create_conversation MCP tool for creating new Fleep conversations
 
 import json
 from typing import Any, Dict, List, Optional
-from pydantic import BaseModel, Field, ValidationError
+from pydantic import BaseModel, Field, TypeAdapter, ValidationError
 
 class CreateConversationRequest(BaseModel):
     """Request model for creating a conversation."""
@@ -24,42 +24,47 @@ class CreateConversationRequest(BaseModel):
         description="Whether members should auto-join the conversation"
     )
 
+_ADAPTER = TypeAdapter(CreateConversationRequest)
+
 class CreateConversationTool:
     """Tool for creating new Fleep conversations."""
     
+    _TOOL_DEF = {
+        "name": "create_conversation",
+        "description": "Create a new Fleep conversation with specified members and optional topic",
+        "inputSchema": {
+            "type": "object",
+            "properties": {
+                "topic": {
+                    "type": "string",
+                    "description": "Optional topic for the conversation"
+                },
+                "member_emails": {
+                    "type": "string",
+                    "description": "List of email addresses to invite to the conversation",
+                },
+                "is_invite": {
+                    "type": "boolean",
+                    "description": "Whether to send invitations to members (default: true)",
+                    "default": True
+                },
+                "is_autojoin": {
+                    "type": "boolean", 
+                    "description": "Whether members should auto-join the conversation (default: false)",
+                    "default": False
+                }
+            },
+            "required": []
+        }
+    }
+    
     def __init__(self, fleep_client):
         self.fleep_client = fleep_client
     
-    def get_tool_definition(self) -> Dict[str, Any]:
+    @classmethod
+    def get_tool_definition(cls) -> Dict[str, Any]:
         """Return the MCP tool definition."""
-        return {
-            "name": "create_conversation",
-            "description": "Create a new Fleep conversation with specified members and optional topic",
-            "inputSchema": {
-                "type": "object",
-                "properties": {
-                    "topic": {
-                        "type": "string",
-                        "description": "Optional topic for the conversation"
-                    },
-                    "member_emails": {
-                        "type": "string",
-                        "description": "List of email addresses to invite to the conversation",
-                    },
-                    "is_invite": {
-                        "type": "boolean",
-                        "description": "Whether to send invitations to members (default: true)",
-                        "default": True
-                    },
-                    "is_autojoin": {
-                        "type": "boolean", 
-                        "description": "Whether members should auto-join the conversation (default: false)",
-                        "default": False
-                    }
-                },
-                "required": []
-            }
-        }
+        return cls._TOOL_DEF
     
     async def execute(self, arguments: Dict[str, Any]) -> Dict[str, Any]:
         """
@@ -77,7 +82,7 @@ class CreateConversationTool:
         """
         try:
             # Validate input arguments
-            request = CreateConversationRequest(**arguments)
+            request = _ADAPTER.validate_python(arguments)
             
             # Call the Fleep API
             result = await self.fleep_client.create_conversation(
@@ -88,18 +93,17 @@ class CreateConversationTool:
             )
             
             # Format the response
-            member_count = len(request.member_emails.split(',')) if request.member_emails else 0
-            response = {
+            member_count = request.member_emails.count(",") + 1 if request.member_emails else 0
+            parts = [f"Successfully created conversation with {member_count} members"]
+            if request.topic:
+                parts.append(f" and topic '{request.topic}'")
+            
+            return {
                 "success": True,
                 "conversation": result,
-                "message": f"Successfully created conversation with {member_count} members"
+                "message": "".join(parts)
             }
             
-            if request.topic:
-                response["message"] += f" and topic '{request.topic}'"
-            
-            return response
-            
         except ValidationError as e:
             return {
                 "success": False,
@@ -6,34 +6,48 @@ Implements the get_conversation_labels MCP tool for retrieving labels from Fleep
 
 import json
 from typing import Any, Dict, List, Optional
-from pydantic import BaseModel, Field, ValidationError
+from pydantic import BaseModel, Field, TypeAdapter, ValidationError
+
+from ._cache import TTLCache, conversation_info_cache, conversation_info_key
+
+# Labels change rarely, so repeated lookups within this window reuse the last response
+LABELS_CACHE_TTL = 30.0
+
+# A conversation header is small, anything bigger than this is not worth parsing
+LABELS_MAX_RESPONSE_BYTES = 256 * 1024
 
 class GetConversationLabelsRequest(BaseModel):
     """Request model for getting conversation labels."""
     conversation_id: str = Field(description="The ID of the conversation to get labels from")
 
+_ADAPTER = TypeAdapter(GetConversationLabelsRequest)
+
 class GetConversationLabelsTool:
     """Tool for retrieving labels from Fleep conversations."""
     
-    def __init__(self, fleep_client):
+    _TOOL_DEF = {
+        "name": "get_conversation_labels",
+        "description": "Get the current labels applied to a Fleep conversation",
+        "inputSchema": {
+            "type": "object",
+            "properties": {
+                "conversation_id": {
+                    "type": "string",
+                    "description": "The ID of the conversation to get labels from"
+                }
+            },
+            "required": ["conversation_id"]
+        }
+    }
+    
+    def __init__(self, fleep_client, cache: Optional[TTLCache] = None):
         self.fleep_client = fleep_client
+        self.cache = conversation_info_cache if cache is None else cache
     
-    def get_tool_definition(self) -> Dict[str, Any]:
+    @classmethod
+    def get_tool_definition(cls) -> Dict[str, Any]:
         """Return the MCP tool definition."""
-        return {
-            "name": "get_conversation_labels",
-            "description": "Get the current labels applied to a Fleep conversation",
-            "inputSchema": {
-                "type": "object",
-                "properties": {
-                    "conversation_id": {
-                        "type": "string",
-                        "description": "The ID of the conversation to get labels from"
-                    }
-                },
-                "required": ["conversation_id"]
-            }
-        }
+        return cls._TOOL_DEF
     
     async def execute(self, arguments: Dict[str, Any]) -> Dict[str, Any]:
         """
@@ -51,12 +65,17 @@ class GetConversationLabelsTool:
         """
         try:
             # Validate input arguments
-            request = GetConversationLabelsRequest(**arguments)
+            request = _ADAPTER.validate_python(arguments)
             
-            # Call the Fleep API to get conversation info
-            result = await self.fleep_client.get_conversation_info(
-                conversation_id=request.conversation_id,
-                detail_level="ic_header"  # Only need header info for labels
+            # Call the Fleep API to get conversation info, unless recently cached
+            result = await self.cache.get_or_set(
+                conversation_info_key(self.fleep_client.email, request.conversation_id, "ic_header"),
+                lambda: self.fleep_client.get_conversation_info(
+                    conversation_id=request.conversation_id,
+                    detail_level="ic_header",  # Only need header info for labels
+                    max_bytes=LABELS_MAX_RESPONSE_BYTES
+                ),
+                ttl=LABELS_CACHE_TTL
             )
             
             # Extract conversation info from the response
@@ -6,7 +6,7 @@ Implements the send_message MCP tool for sending messages to Fleep conversations
 
 import json
 from typing import Any, Dict, List, Optional
-from pydantic import BaseModel, Field, ValidationError
+from pydantic import BaseModel, Field, TypeAdapter, ValidationError
 
 class SendMessageRequest(BaseModel):
     """Request model for sending a message."""
@@ -21,37 +21,42 @@ class SendMessageRequest(BaseModel):
         description="Optional list of attachment URLs"
     )
 
+_ADAPTER = TypeAdapter(SendMessageRequest)
+
 class SendMessageTool:
     """Tool for sending messages to Fleep conversations."""
     
+    _TOOL_DEF = {
+        "name": "send_message",
+        "description": "Send a message to a Fleep conversation by conversation ID",
+        "inputSchema": {
+            "type": "object",
+            "properties": {
+                "conversation_id": {
+                    "type": "string",
+                    "description": "Conversation ID where to send the message"
+                },
+                "message": {
+                    "type": "string",
+                    "description": "Message content to send"
+                },
+                "attachments": {
+                    "type": "array",
+                    "items": {"type": "string"},
+                    "description": "Optional list of attachment URLs"
+                }
+            },
+            "required": ["conversation_id", "message"]
+        }
+    }
+    
     def __init__(self, fleep_client):
         self.fleep_client = fleep_client
     
-    def get_tool_definition(self) -> Dict[str, Any]:
+    @classmethod
+    def get_tool_definition(cls) -> Dict[str, Any]:
         """Return the MCP tool definition."""
-        return {
-            "name": "send_message",
-            "description": "Send a message to a Fleep conversation by conversation ID",
-            "inputSchema": {
-                "type": "object",
-                "properties": {
-                    "conversation_id": {
-                        "type": "string",
-                        "description": "Conversation ID where to send the message"
-                    },
-                    "message": {
-                        "type": "string",
-                        "description": "Message content to send"
-                    },
-                    "attachments": {
-                        "type": "array",
-                        "items": {"type": "string"},
-                        "description": "Optional list of attachment URLs"
-                    }
-                },
-                "required": ["conversation_id", "message"]
-            }
-        }
+        return cls._TOOL_DEF
     
     async def execute(self, arguments: Dict[str, Any]) -> Dict[str, Any]:
         """
@@ -69,7 +74,7 @@ class SendMessageTool:
         """
         try:
             # Validate input arguments
-            request = SendMessageRequest(**arguments)
+            request = _ADAPTER.validate_python(arguments)
             
             # Call the Fleep API
             result = await self.fleep_client.send_message(
@@ -79,17 +84,16 @@ class SendMessageTool:
             )
             
             # Format the response
-            response = {
-                "success": True,
-                "result": result,
-                "message": f"Successfully sent message to conversation {request.conversation_id}"
-            }
-            
+            parts = [f"Successfully sent message to conversation {request.conversation_id}"]
             if request.attachments:
                 attachment_count = len(request.attachments)
-                response["message"] += f" with {attachment_count} attachment{'s' if attachment_count > 1 else ''}"
+                parts.append(f" with {attachment_count} attachment{'s' if attachment_count > 1 else ''}")
             
-            return response
+            return {
+                "success": True,
+                "result": result,
+                "message": "".join(parts)
+            }
             
         except ValidationError as e:
             return {
@@ -6,43 +6,51 @@ Implements the set_conversation_labels MCP tool for applying labels to Fleep con
 
 import json
 from typing import Any, Dict, List, Optional
-from pydantic import BaseModel, Field, ValidationError
+from pydantic import BaseModel, Field, TypeAdapter, ValidationError
+
+from ._cache import TTLCache, conversation_info_cache, conversation_info_key
 
 class SetConversationLabelsRequest(BaseModel):
     """Request model for setting conversation labels."""
     conversation_id: str = Field(description="The ID of the conversation to set labels on")
     labels: List[str] = Field(description="List of label strings to apply to the conversation")
 
+_ADAPTER = TypeAdapter(SetConversationLabelsRequest)
+
 class SetConversationLabelsTool:
     """Tool for setting labels on Fleep conversations."""
     
-    def __init__(self, fleep_client):
+    _TOOL_DEF = {
+        "name": "set_conversation_labels",
+        "description": "Set labels on a Fleep conversation. This will replace any existing labels.",
+        "inputSchema": {
+            "type": "object",
+            "properties": {
+                "conversation_id": {
+                    "type": "string",
+                    "description": "The ID of the conversation to set labels on"
+                },
+                "labels": {
+                    "type": "array",
+                    "items": {
+                        "type": "string"
+                    },
+                    "description": "Array of label strings to apply to the conversation",
+                    "examples": [["urgent", "project-alpha"], ["meeting", "important"]]
+                }
+            },
+            "required": ["conversation_id", "labels"]
+        }
+    }
+    
+    def __init__(self, fleep_client, cache: Optional[TTLCache] = None):
         self.fleep_client = fleep_client
+        self.cache = conversation_info_cache if cache is None else cache
     
-    def get_tool_definition(self) -> Dict[str, Any]:
+    @classmethod
+    def get_tool_definition(cls) -> Dict[str, Any]:
         """Return the MCP tool definition."""
-        return {
-            "name": "set_conversation_labels",
-            "description": "Set labels on a Fleep conversation. This will replace any existing labels.",
-            "inputSchema": {
-                "type": "object",
-                "properties": {
-                    "conversation_id": {
-                        "type": "string",
-                        "description": "The ID of the conversation to set labels on"
-                    },
-                    "labels": {
-                        "type": "array",
-                        "items": {
-                            "type": "string"
-                        },
-                        "description": "Array of label strings to apply to the conversation",
-                        "examples": [["urgent", "project-alpha"], ["meeting", "important"]]
-                    }
-                },
-                "required": ["conversation_id", "labels"]
-            }
-        }
+        return cls._TOOL_DEF
     
     async def execute(self, arguments: Dict[str, Any]) -> Dict[str, Any]:
         """
@@ -60,7 +68,7 @@ class SetConversationLabelsTool:
         """
         try:
             # Validate input arguments
-            request = SetConversationLabelsRequest(**arguments)
+            request = _ADAPTER.validate_python(arguments)
             
             # Call the Fleep API to set labels
             result = await self.fleep_client.set_conversation_labels(
@@ -68,6 +76,11 @@ class SetConversationLabelsTool:
                 labels=request.labels
             )
             
+            # Make sure get_conversation_labels doesn't serve the old labels
+            self.cache.invalidate(
+                conversation_info_key(self.fleep_client.email, request.conversation_id, "ic_header")
+            )
+            
             # Format the response
             response = {
                 "success": True,
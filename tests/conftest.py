@@ -0,0 +1,79 @@
+"""
+Shared fixtures for the Fleep MCP Server tests.
+"""
+
+import pytest
+from pathlib import Path
+from unittest.mock import AsyncMock
+
+_TESTS_DIR = Path(__file__).parent
+
+
+def pytest_collection_modifyitems(config, items):
+    """Mark every test in this directory as fast; they only talk to mocks."""
+    for item in items:
+        if _TESTS_DIR in item.path.parents:
+            item.add_marker(pytest.mark.fast)
+
+
+class StubFleepClient:
+    """Lightweight stand-in for FleepClient with an AsyncMock per API method."""
+    
+    API_METHODS = (
+        "create_conversation",
+        "get_conversation_info",
+        "set_conversation_labels",
+        "send_message",
+    )
+    
+    # Account the cached conversation info is keyed by
+    email = "user@example.com"
+    
+    def __init__(self):
+        for name in self.API_METHODS:
+            setattr(self, name, AsyncMock())
+    
+    def reset_mock(self):
+        """Clear call history, return values and side effects of every API method."""
+        for name in self.API_METHODS:
+            method = getattr(self, name)
+            if isinstance(method, AsyncMock):
+                method.reset_mock(return_value=True, side_effect=True)
+            else:
+                # A test swapped in its own stub, e.g. from async_return
+                setattr(self, name, AsyncMock())
+    
+    def called_methods(self):
+        """Return the names of the API methods that were called."""
+        return [name for name in self.API_METHODS if getattr(self, name).called]
+
+
+def _async_return(value):
+    """Return a coroutine function that records its keyword arguments and returns value."""
+    calls = []
+    
+    async def stub(**kwargs):
+        calls.append(kwargs)
+        return value
+    
+    stub.calls = calls
+    return stub
+
+
+@pytest.fixture(scope="session")
+def async_return():
+    """Provide a cheap replacement for AsyncMock on happy-path tests."""
+    return _async_return
+
+
+@pytest.fixture(scope="session")
+def mock_fleep_client():
+    """Create a stub Fleep client shared by the whole test session."""
+    return StubFleepClient()
+
+
+@pytest.fixture(autouse=True)
+def _reset_mock_fleep_client(mock_fleep_client):
+    """Clear call history, return values and side effects after every test."""
+    yield
+    mock_fleep_client.reset_mock()
@@ -0,0 +1,135 @@
+"""
+Tests for the batch tool.
+"""
+
+import asyncio
+import pytest
+from unittest.mock import AsyncMock
+from src.tools.batch import MAX_BATCH_CALLS, BatchTool
+
+
+@pytest.fixture
+def executors():
+    """Create mocked tool executors."""
+    return {
+        "send_message": AsyncMock(return_value={"success": True, "message": "sent"}),
+        "get_conversation_labels": AsyncMock(return_value={"success": True, "labels": ["urgent"]})
+    }
+
+
+@pytest.fixture
+def batch_tool(executors):
+    """Create a BatchTool instance with mocked executors."""
+    return BatchTool(executors)
+
+
+class TestBatchTool:
+    """Test the BatchTool class."""
+    
+    async def test_batch_success(self, batch_tool, executors):
+        """Test that every call is executed and results keep request order."""
+        arguments = {
+            "calls": [
+                {"name": "get_conversation_labels", "arguments": {"conversation_id": "conv-123"}},
+                {"name": "send_message", "arguments": {"conversation_id": "conv-123", "message": "Hi"}}
+            ]
+        }
+        result = await batch_tool.execute(arguments)
+        
+        assert result["success"] is True
+        assert [r["name"] for r in result["results"]] == ["get_conversation_labels", "send_message"]
+        assert result["results"][0]["labels"] == ["urgent"]
+        assert "Executed 2 call(s), 0 failed" in result["message"]
+        
+        assert executors["get_conversation_labels"].call_count == 1
+        assert executors["get_conversation_labels"].call_args.args == ({"conversation_id": "conv-123"},)
+        assert executors["send_message"].call_count == 1
+        assert executors["send_message"].call_args.args == ({"conversation_id": "conv-123", "message": "Hi"},)
+    
+    async def test_batch_runs_calls_concurrently(self):
+        """Test that calls in a batch overlap instead of running one after another."""
+        running = 0
+        peak = 0
+        
+        async def execute(arguments):
+            nonlocal running, peak
+            running += 1
+            peak = max(peak, running)
+            await asyncio.sleep(0)
+            running -= 1
+            return {"success": True}
+        
+        batch_tool = BatchTool({"send_message": execute})
+        await batch_tool.execute({"calls": [{"name": "send_message"}] * 3})
+        
+        assert peak == 3
+    
+    async def test_batch_reports_failures_per_call(self, batch_tool, executors):
+        """Test that unknown tools and raised exceptions only fail their own call."""
+        executors["send_message"].side_effect = Exception("API Error")
+        
+        arguments = {
+            "calls": [
+                {"name": "unknown_tool"},
+                {"name": "send_message", "arguments": {"conversation_id": "conv-123", "message": "Hi"}},
+                {"name": "get_conversation_labels", "arguments": {"conversation_id": "conv-123"}}
+            ]
+        }
+        result = await batch_tool.execute(arguments)
+        
+        assert result["success"] is True
+        unknown, failed, succeeded = result["results"]
+        assert unknown["success"] is False
+        assert unknown["error"] == "Unknown tool"
+        assert failed["success"] is False
+        assert "API Error" in failed["details"]
+        assert succeeded["success"] is True
+        assert "2 failed" in result["message"]
+    
+    async def test_batch_reports_cancelled_call(self, batch_tool, executors):
+        """Test that a cancelled call fails on its own instead of failing the batch."""
+        executors["send_message"].side_effect = asyncio.CancelledError()
+        
+        arguments = {
+            "calls": [
+                {"name": "send_message", "arguments": {"conversation_id": "conv-123", "message": "Hi"}},
+                {"name": "get_conversation_labels", "arguments": {"conversation_id": "conv-123"}}
+            ]
+        }
+        result = await batch_tool.execute(arguments)
+        
+        assert result["success"] is True
+        cancelled, succeeded = result["results"]
+        assert cancelled["success"] is False
+        assert cancelled["details"] == "CancelledError"
+        assert succeeded["success"] is True
+        assert "1 failed" in result["message"]
+    
+    async def test_batch_invalid_arguments(self, batch_tool):
+        """Test error handling when calls are missing."""
+        result = await batch_tool.execute({})
+        
+        assert result["success"] is False
+        assert result["error"] == "Invalid arguments"
+        assert "details" in result
+    
+    async def test_batch_rejects_too_many_calls(self, batch_tool, executors):
+        """Test that a batch over the call limit is rejected before anything runs."""
+        call = {"name": "send_message", "arguments": {"conversation_id": "conv-123", "message": "Hi"}}
+        
+        result = await batch_tool.execute({"calls": [call] * (MAX_BATCH_CALLS + 1)})
+        
+        assert result["success"] is False
+        assert result["error"] == "Invalid arguments"
+        executors["send_message"].assert_not_called()
+    
+    def test_batch_tool_definition(self, batch_tool):
+        """Test the tool definition."""
+        definition = batch_tool.get_tool_definition()
+        
+        assert definition["name"] == "batch"
+        assert "description" in definition
+        assert definition["inputSchema"]["type"] == "object"
+        assert definition["inputSchema"]["properties"]["calls"]["type"] == "array"
+        assert definition["inputSchema"]["properties"]["calls"]["maxItems"] == MAX_BATCH_CALLS
+        assert definition["inputSchema"]["required"] == ["calls"]
@@ -0,0 +1,93 @@
+"""
+Tests for the tool response cache.
+"""
+
+import asyncio
+import pytest
+from unittest.mock import AsyncMock
+from src.tools._cache import TTLCache
+
+
+class TestTTLCache:
+    """Test the TTLCache."""
+    
+    async def test_get_or_set_caches_value(self):
+        """Test that a cached value is returned without calling the factory again."""
+        cache = TTLCache()
+        factory = AsyncMock(return_value="value")
+        
+        assert await cache.get_or_set("key", factory) == "value"
+        assert await cache.get_or_set("key", factory) == "value"
+        assert factory.call_count == 1
+    
+    async def test_get_or_set_expired_entry(self):
+        """Test that an expired entry is recomputed."""
+        cache = TTLCache()
+        factory = AsyncMock(side_effect=["old", "new"])
+        
+        assert await cache.get_or_set("key", factory, ttl=0) == "old"
+        assert await cache.get_or_set("key", factory) == "new"
+        assert factory.call_count == 2
+    
+    async def test_get_or_set_coalesces_concurrent_misses(self):
+        """Test that concurrent misses for one key share a single factory call."""
+        cache = TTLCache()
+        calls = 0
+        
+        async def factory():
+            nonlocal calls
+            calls += 1
+            await asyncio.sleep(0)
+            return "value"
+        
+        results = await asyncio.gather(*(cache.get_or_set("key", factory) for _ in range(5)))
+        
+        assert results == ["value"] * 5
+        assert calls == 1
+    
+    async def test_get_or_set_does_not_cache_errors(self):
+        """Test that a failing factory leaves no entry behind."""
+        cache = TTLCache()
+        factory = AsyncMock(side_effect=[Exception("API Error"), "value"])
+        
+        with pytest.raises(Exception, match="API Error"):
+            await cache.get_or_set("key", factory)
+        assert await cache.get_or_set("key", factory) == "value"
+    
+    @pytest.mark.parametrize("drop", [
+        lambda cache: cache.invalidate("key"),
+        lambda cache: cache.clear(),
+    ], ids=["invalidate", "clear"])
+    async def test_get_or_set_skips_caching_after_invalidation(self, drop):
+        """Test that a value computed across an invalidation is returned but not cached."""
+        cache = TTLCache()
+        release = asyncio.Event()
+        
+        async def factory():
+            await release.wait()
+            return "stale"
+        
+        pending = asyncio.create_task(cache.get_or_set("key", factory))
+        await asyncio.sleep(0)
+        drop(cache)
+        release.set()
+        
+        assert await pending == "stale"
+        assert cache.get("key") is None
+        assert await cache.get_or_set("key", AsyncMock(return_value="fresh")) == "fresh"
+        assert cache.get("key") == "fresh"
+    
+    def test_lru_eviction_and_invalidate(self):
+        """Test that the least recently used entry is evicted and invalidate drops keys."""
+        cache = TTLCache(maxsize=2)
+        cache.set("a", 1)
+        cache.set("b", 2)
+        cache.get("a")
+        cache.set("c", 3)
+        
+        assert cache.get("b") is None
+        assert cache.get("a") == 1
+        
+        cache.invalidate("a")
+        assert cache.get("a") is None
+        assert cache.get("c") == 3
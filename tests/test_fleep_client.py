@@ -0,0 +1,398 @@
+"""
+Tests for the Fleep API client.
+"""
+
+import asyncio
+import json
+import stat
+from datetime import datetime, timedelta, timezone
+from email.utils import format_datetime
+import httpx
+import pytest
+from unittest.mock import AsyncMock
+from src import fleep_client as fleep_client_module
+from src.fleep_client import FleepAPIError, FleepClient, _FleepConfig
+
+
+@pytest.fixture
+def sleep(monkeypatch):
+    """Replace the client's sleep so retries don't actually wait."""
+    mock_sleep = AsyncMock()
+    monkeypatch.setattr(fleep_client_module, "_sleep", mock_sleep)
+    return mock_sleep
+
+
+@pytest.fixture(autouse=True)
+def config(monkeypatch):
+    """Provide test credentials regardless of the local environment."""
+    test_config = _FleepConfig(email="user@example.com", password="secret", session_cache=False)
+    monkeypatch.setattr(fleep_client_module, "_CONFIG", test_config)
+    return test_config
+
+
+def make_client(responses, **kwargs):
+    """Create a FleepClient whose HTTP traffic is served from a list of responses."""
+    requests = []
+
+    async def handler(request):
+        requests.append(request)
+        # Yield to the event loop like a real network round trip would
+        await asyncio.sleep(0)
+        if request.url.path.endswith("/account/login"):
+            return httpx.Response(
+                200,
+                json={"ticket": "ticket-1"},
+                headers={"Set-Cookie": "token_id=token-1; Path=/api/account"}
+            )
+        return responses.pop(0)
+
+    client = FleepClient(**kwargs)
+    client._client = httpx.AsyncClient(
+        base_url=client.base_url,
+        transport=httpx.MockTransport(handler)
+    )
+    # Mirror _ensure_client, which puts a restored session into the cookie jar
+    client._store_session_cookie()
+    client.requests = requests
+    return client
+
+
+@pytest.fixture
+def session_cache(monkeypatch, tmp_path, config):
+    """Enable the session cache and point it at a temporary file."""
+    cache_path = tmp_path / "fleep-mcp" / "session.json"
+    monkeypatch.setattr(fleep_client_module, "SESSION_CACHE_PATH", cache_path)
+    monkeypatch.setattr(fleep_client_module, "_CONFIG", _FleepConfig(
+        email=config.email,
+        password=config.password,
+        session_cache=True
+    ))
+    return cache_path
+
+
+def write_session_cache(cache_path, **cached):
+    """Write a session cache file as a previous run would have left it."""
+    cache_path.parent.mkdir(parents=True, exist_ok=True)
+    cache_path.write_text(json.dumps({"email": "user@example.com", "ts": 0, **cached}))
+
+
+def login_requests(client):
+    """Return the login requests the client has sent."""
+    return [r for r in client.requests if r.url.path.endswith("/account/login")]
+
+
+class TestClientSetup:
+    """Test how the HTTP client is created."""
+    
+    async def test_client_is_created_lazily(self):
+        """Test that the HTTP client is created on first use with the pool settings and then reused."""
+        client = FleepClient()
+        assert client._client is None
+        
+        http = await client._ensure_client()
+        
+        assert await client._ensure_client() is http
+        assert str(http.base_url) == "https://fleep.io/api/"
+        assert http.timeout == httpx.Timeout(connect=5.0, read=30.0, write=15.0, pool=5.0)
+        pool = http._transport._pool
+        assert pool._http2 is True
+        assert pool._max_connections == 256
+        assert pool._max_keepalive_connections == 32
+        assert pool._keepalive_expiry == 60.0
+        await client.close()
+        assert client._client is None
+    
+    async def test_client_honors_proxy_environment(self, monkeypatch):
+        """Test that HTTPS_PROXY routes requests through the proxy."""
+        monkeypatch.setenv("HTTPS_PROXY", "http://proxy.example:3128")
+        client = FleepClient()
+        
+        http = await client._ensure_client()
+        
+        assert [pattern.pattern for pattern in http._mounts] == ["https://"]
+        await client.close()
+
+
+class TestMakeRequest:
+    """Test authenticated requests to the Fleep API."""
+    
+    async def test_make_request_sends_session_cookie_and_ticket(self):
+        """Test that API calls carry the token_id cookie and the ticket."""
+        client = make_client([httpx.Response(200, json={"ok": True})])
+        
+        await client._make_request("POST", "message/send/conv-123", {"message": "Hi"})
+        
+        request = client.requests[-1]
+        assert request.url.path == "/api/message/send/conv-123"
+        assert request.headers["Cookie"] == "token_id=token-1"
+        assert request.headers["Content-Type"] == "application/json"
+        assert json.loads(request.content) == {"message": "Hi", "ticket": "ticket-1"}
+    
+    async def test_make_request_sends_session_cookie_to_local_host(self):
+        """Test that the token_id cookie is sent when base_url has no dotted domain."""
+        client = make_client([httpx.Response(200, json={"ok": True})], base_url="http://localhost:8080/api")
+        
+        await client._make_request("POST", "conversation/sync/conv-123")
+        
+        request = client.requests[-1]
+        assert request.url.host == "localhost"
+        assert request.headers["Cookie"] == "token_id=token-1"
+    
+    async def test_make_request_rejects_oversized_response(self):
+        """Test that a body larger than max_bytes raises instead of being parsed."""
+        client = make_client([httpx.Response(200, content=b'{"labels": "' + b"x" * 2048 + b'"}')])
+        
+        with pytest.raises(FleepAPIError, match="too large"):
+            await client._make_request("POST", "conversation/sync/conv-123", max_bytes=1024)
+    
+    async def test_make_request_streams_response_within_limit(self):
+        """Test that a body within max_bytes is parsed normally."""
+        client = make_client([httpx.Response(200, json={"ok": True})])
+        
+        result = await client._make_request("POST", "conversation/sync/conv-123", max_bytes=1024)
+        
+        assert result == {"ok": True}
+    
+    async def test_debug_logging_redacts_secrets(self, caplog):
+        """Test that the ticket and session token never reach the logs."""
+        client = make_client([httpx.Response(200, json={"ok": True})])
+        
+        with caplog.at_level("DEBUG", logger="src.fleep_client"):
+            await client._make_request("POST", "conversation/sync/conv-123")
+        
+        assert "Making POST request" in caplog.text
+        assert "ticket-1" not in caplog.text
+        assert "token-1" not in caplog.text
+
+
+class TestRetries:
+    """Test retries and re-authentication."""
+    
+    async def test_make_request_retries_on_server_error(self, sleep):
+        """Test that 5xx responses to reads are retried with backoff."""
+        client = make_client([
+            httpx.Response(503),
+            httpx.Response(502),
+            httpx.Response(504),
+            httpx.Response(200, json={"ok": True})
+        ])
+        
+        result = await client.get_conversation_info("conv-123")
+        
+        assert result == {"ok": True}
+        assert sleep.call_count == 3
+    
+    @pytest.mark.parametrize("status_code", [502, 504])
+    async def test_send_message_is_not_resent_after_gateway_error(self, sleep, status_code):
+        """Test that a write is not retried when Fleep may already have applied it."""
+        client = make_client([httpx.Response(status_code)])
+        
+        with pytest.raises(FleepAPIError):
+            await client.send_message("conv-123", "Hi")
+        
+        sends = [r for r in client.requests if r.url.path.endswith("/message/send/conv-123")]
+        assert len(sends) == 1
+        sleep.assert_not_called()
+    
+    async def test_send_message_retries_unavailable(self, sleep):
+        """Test that a 503, which Fleep rejects before processing, is retried for writes."""
+        client = make_client([httpx.Response(503), httpx.Response(200, json={"ok": True})])
+        
+        result = await client.send_message("conv-123", "Hi")
+        
+        assert result == {"ok": True}
+        assert sleep.call_count == 1
+    
+    async def test_make_request_honors_retry_after(self, sleep):
+        """Test that a 429 waits for the Retry-After interval."""
+        client = make_client([
+            httpx.Response(429, headers={"Retry-After": "7"}),
+            httpx.Response(200, json={"ok": True})
+        ])
+        
+        result = await client._make_request("POST", "conversation/sync/conv-123")
+        
+        assert result == {"ok": True}
+        assert sleep.call_count == 1
+        assert sleep.call_args.args == (7.0,)
+    
+    async def test_make_request_honors_retry_after_http_date(self, sleep):
+        """Test that a Retry-After given as an HTTP date waits until that time."""
+        retry_at = format_datetime(datetime.now(timezone.utc) + timedelta(seconds=10), usegmt=True)
+        client = make_client([
+            httpx.Response(429, headers={"Retry-After": retry_at}),
+            httpx.Response(200, json={"ok": True})
+        ])
+        
+        result = await client._make_request("POST", "conversation/sync/conv-123")
+        
+        assert result == {"ok": True}
+        assert sleep.call_count == 1
+        assert 8.0 <= sleep.call_args.args[0] <= 10.0
+    
+    async def test_make_request_gives_up_on_long_retry_after(self, sleep):
+        """Test that a Retry-After beyond the backoff cap fails at once instead of waiting."""
+        client = make_client([httpx.Response(429, headers={"Retry-After": "31"})])
+        
+        with pytest.raises(FleepAPIError):
+            await client._make_request("POST", "conversation/sync/conv-123")
+        
+        sleep.assert_not_called()
+    
+    async def test_make_request_stops_at_wait_budget(self, sleep):
+        """Test that the total time spent waiting between retries is bounded."""
+        client = make_client([httpx.Response(429, headers={"Retry-After": "25"})] * 3)
+        
+        with pytest.raises(FleepAPIError):
+            await client._make_request("POST", "conversation/sync/conv-123")
+        
+        assert [call.args for call in sleep.call_args_list] == [(25.0,), (25.0,)]
+    
+    async def test_make_request_gives_up_after_max_retries(self, sleep):
+        """Test that retries are bounded."""
+        client = make_client([httpx.Response(503)] * (fleep_client_module.MAX_RETRIES + 1))
+        
+        with pytest.raises(FleepAPIError):
+            await client._make_request("POST", "conversation/sync/conv-123")
+        
+        assert sleep.call_count == fleep_client_module.MAX_RETRIES
+    
+    async def test_make_request_does_not_retry_client_errors(self, sleep):
+        """Test that non-retryable 4xx responses fail immediately."""
+        client = make_client([httpx.Response(400)])
+        
+        with pytest.raises(FleepAPIError):
+            await client._make_request("POST", "conversation/sync/conv-123")
+        
+        sleep.assert_not_called()
+    
+    async def test_make_request_reauthenticates_on_401(self, sleep):
+        """Test that a 401 triggers a single re-login and retry."""
+        client = make_client([
+            httpx.Response(401),
+            httpx.Response(200, json={"ok": True})
+        ])
+        
+        result = await client._make_request("POST", "conversation/sync/conv-123")
+        
+        assert result == {"ok": True}
+        logins = [r for r in client.requests if r.url.path.endswith("/account/login")]
+        assert len(logins) == 2
+    
+    async def test_concurrent_requests_share_one_login(self):
+        """Test that requests racing for a session only log in once."""
+        client = make_client([httpx.Response(200, json={"ok": True}) for _ in range(5)])
+        
+        await asyncio.gather(*(
+            client._make_request("POST", "conversation/sync/conv-123") for _ in range(5)
+        ))
+        
+        logins = [r for r in client.requests if r.url.path.endswith("/account/login")]
+        assert len(logins) == 1
+
+
+class TestSessionCache:
+    """Test the on-disk session cache."""
+    
+    async def test_login_writes_private_session_cache(self, session_cache):
+        """Test that a login persists the session readable only by the user."""
+        client = make_client([httpx.Response(200, json={"ok": True})])
+        
+        await client._make_request("POST", "conversation/sync/conv-123")
+        
+        assert stat.S_IMODE(session_cache.stat().st_mode) == 0o600
+        cached = json.loads(session_cache.read_text())
+        assert cached["email"] == "user@example.com"
+        assert cached["token_id"] == "token-1"
+        assert cached["ticket"] == "ticket-1"
+    
+    async def test_cached_session_is_reused(self, session_cache):
+        """Test that a new client restores the cached session instead of logging in."""
+        write_session_cache(session_cache, token_id="cached-token", ticket="cached-ticket")
+        client = make_client([httpx.Response(200, json={"ok": True})])
+        
+        await client._make_request("POST", "conversation/sync/conv-123")
+        
+        assert login_requests(client) == []
+        request = client.requests[-1]
+        assert request.headers["Cookie"] == "token_id=cached-token"
+        assert json.loads(request.content)["ticket"] == "cached-ticket"
+    
+    async def test_cached_session_for_other_account_is_ignored(self, session_cache):
+        """Test that a session cached for a different email is never reused."""
+        write_session_cache(session_cache, email="other@example.com", token_id="other-token", ticket="other-ticket")
+        client = make_client([httpx.Response(200, json={"ok": True})])
+        
+        await client._make_request("POST", "conversation/sync/conv-123")
+        
+        assert len(login_requests(client)) == 1
+        assert client.requests[-1].headers["Cookie"] == "token_id=token-1"
+    
+    async def test_rejected_session_removes_cache(self, session_cache, sleep):
+        """Test that a 401 discards the cached session and caches the new one."""
+        write_session_cache(session_cache, token_id="cached-token", ticket="cached-ticket")
+        client = make_client([httpx.Response(401), httpx.Response(200, json={"ok": True})])
+        cache_existed_on_login = []
+        
+        # Record whether the stale file was still there when the client logged in again
+        login = client._login
+        
+        async def recording_login():
+            cache_existed_on_login.append(session_cache.exists())
+            await login()
+        
+        client._login = recording_login
+        
+        await client._make_request("POST", "conversation/sync/conv-123")
+        
+        assert cache_existed_on_login == [False]
+        assert json.loads(session_cache.read_text())["token_id"] == "token-1"
+    
+    async def test_corrupt_session_cache_falls_back_to_login(self, session_cache):
+        """Test that an unreadable cache file is ignored."""
+        session_cache.parent.mkdir(parents=True)
+        session_cache.write_text("{not json")
+        client = make_client([httpx.Response(200, json={"ok": True})])
+        
+        result = await client._make_request("POST", "conversation/sync/conv-123")
+        
+        assert result == {"ok": True}
+        assert len(login_requests(client)) == 1
+    
+    async def test_failed_session_cache_write_does_not_break_login(self, session_cache):
+        """Test that login succeeds even when the cache can't be written."""
+        # A regular file where the cache directory should be makes mkdir fail
+        session_cache.parent.write_text("")
+        client = make_client([httpx.Response(200, json={"ok": True})])
+        
+        result = await client._make_request("POST", "conversation/sync/conv-123")
+        
+        assert result == {"ok": True}
+        assert client.session_token == "token-1"
+        assert session_cache.parent.read_text() == ""
+    
+    async def test_session_cache_follows_xdg_cache_home(self, session_cache, monkeypatch, tmp_path):
+        """Test that the default cache location honors XDG_CACHE_HOME."""
+        monkeypatch.setattr(fleep_client_module, "SESSION_CACHE_PATH", None)
+        monkeypatch.setenv("XDG_CACHE_HOME", str(tmp_path / "xdg"))
+        client = make_client([httpx.Response(200, json={"ok": True})])
+        
+        await client._make_request("POST", "conversation/sync/conv-123")
+        
+        cached = json.loads((tmp_path / "xdg" / "fleep-mcp" / "session.json").read_text())
+        assert cached["token_id"] == "token-1"
+    
+    async def test_session_cache_without_home_does_not_break_login(self, session_cache, monkeypatch):
+        """Test that a missing home directory only disables the cache."""
+        def no_home():
+            raise RuntimeError("Could not determine home directory.")
+        
+        monkeypatch.setattr(fleep_client_module, "SESSION_CACHE_PATH", None)
+        monkeypatch.delenv("XDG_CACHE_HOME", raising=False)
+        monkeypatch.setattr(fleep_client_module.Path, "home", no_home)
+        client = make_client([httpx.Response(200, json={"ok": True})])
+        
+        result = await client._make_request("POST", "conversation/sync/conv-123")
+        
+        assert result == {"ok": True}
+        assert client.session_token == "token-1"
@@ -0,0 +1,152 @@
+"""
+Tests for the MCP server entry point.
+"""
+
+import json
+import logging
+import logging.handlers
+import pytest
+from contextlib import asynccontextmanager
+from decimal import Decimal
+from src import main as main_module
+
+_TOOL_CACHES = (main_module._tools, main_module._tool_defs, main_module._dispatch)
+
+
+def queue_handlers():
+    """Return the queue handlers attached to the root logger."""
+    return [h for h in logging.getLogger().handlers if isinstance(h, logging.handlers.QueueHandler)]
+
+
+@pytest.fixture
+def shared_client(monkeypatch, mock_fleep_client):
+    """Serve the stub client from FleepClient.shared and rebuild the tool registry around it."""
+    calls = []
+
+    def shared():
+        calls.append(None)
+        return mock_fleep_client
+
+    monkeypatch.setattr(main_module.FleepClient, "shared", shared)
+    for cached in _TOOL_CACHES:
+        cached.cache_clear()
+    yield calls
+    for cached in _TOOL_CACHES:
+        cached.cache_clear()
+
+
+def decode(content):
+    """Return the JSON payload of a single text content item."""
+    assert len(content) == 1
+    assert content[0].type == "text"
+    return json.loads(content[0].text)
+
+
+@pytest.fixture
+def root_level():
+    """Restore the root logger level that main() changes."""
+    root_logger = logging.getLogger()
+    level = root_logger.level
+    yield
+    root_logger.setLevel(level)
+
+
+class TestLogging:
+    """Test the logging setup."""
+    
+    def test_import_does_not_configure_logging(self):
+        """Test that importing the module leaves the root logger alone."""
+        assert queue_handlers() == []
+    
+    async def test_main_logs_through_queue_until_exit(self, monkeypatch, capsys, mock_fleep_client, root_level):
+        """Test that main() installs queued logging while running and removes it on exit."""
+        handlers_while_running = []
+        
+        @asynccontextmanager
+        async def stdio_server():
+            yield None, None
+        
+        async def run(read_stream, write_stream, initialization_options):
+            handlers_while_running.extend(queue_handlers())
+            main_module.logger.info("Serving")
+        
+        monkeypatch.setattr(main_module, "get_client", lambda: mock_fleep_client)
+        monkeypatch.setattr(main_module, "stdio_server", stdio_server)
+        monkeypatch.setattr(main_module.server, "run", run)
+        
+        await main_module.main()
+        
+        assert len(handlers_while_running) == 1
+        assert queue_handlers() == []
+        stderr = capsys.readouterr().err
+        assert "Starting Fleep MCP Server..." in stderr
+        assert "Serving" in stderr
+
+
+class TestToolHandlers:
+    """Test the tools/list and tools/call handlers."""
+    
+    async def test_list_tools_builds_client_once(self, shared_client):
+        """Test that the client is created on the first request and then reused."""
+        assert shared_client == []
+        
+        first = await main_module.handle_list_tools()
+        second = await main_module.handle_list_tools()
+        
+        assert [tool["name"] for tool in first] == [
+            "create_conversation",
+            "send_message",
+            "get_conversation_labels",
+            "set_conversation_labels",
+            "batch",
+        ]
+        assert second is first
+        assert len(shared_client) == 1
+    
+    async def test_call_tool_dispatches_and_encodes_result(self, shared_client, mock_fleep_client, async_return):
+        """Test that results are encoded as JSON, including values JSON can't express natively."""
+        mock_fleep_client.send_message = async_return({"score": Decimal("1.50"), 1: "one"})
+        
+        content = await main_module.handle_call_tool(
+            "send_message", {"conversation_id": "conv-123", "message": "Hi"}
+        )
+        
+        result = decode(content)
+        assert result["success"] is True
+        assert result["result"] == {"score": "1.50", "1": "one"}
+        assert mock_fleep_client.send_message.calls == [{
+            "conversation_id": "conv-123",
+            "message": "Hi",
+            "attachments": None
+        }]
+    
+    async def test_call_tool_unknown_tool(self, shared_client):
+        """Test that an unknown tool name is reported as an error."""
+        content = await main_module.handle_call_tool("unknown_tool", {})
+        
+        assert len(content) == 1
+        assert content[0].text == "Error: Unknown tool: unknown_tool"
+    
+    async def test_call_tool_without_arguments(self, shared_client, mock_fleep_client):
+        """Test that missing arguments are validated like an empty object."""
+        result = decode(await main_module.handle_call_tool("get_conversation_labels", None))
+        
+        assert result["success"] is False
+        assert result["error"] == "Invalid arguments"
+        assert mock_fleep_client.called_methods() == []
+    
+    async def test_call_tool_batch_does_not_nest(self, shared_client, mock_fleep_client, async_return):
+        """Test that batches reach the other tools but not the batch tool itself."""
+        mock_fleep_client.send_message = async_return({"status": "sent"})
+        
+        content = await main_module.handle_call_tool("batch", {
+            "calls": [
+                {"name": "send_message", "arguments": {"conversation_id": "conv-123", "message": "Hi"}},
+                {"name": "batch", "arguments": {"calls": []}}
+            ]
+        })
+        
+        sent, nested = decode(content)["results"]
+        assert sent["success"] is True
+        assert nested["success"] is False
+        assert nested["error"] == "Unknown tool"
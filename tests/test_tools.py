@@ -0,0 +1,393 @@
+"""
+Tests for the MCP tools.
+
+Covers the tool definitions, successful execution against a stubbed client
+and the error responses shared by all tools.
+"""
+
+import asyncio
+import pytest
+from types import MappingProxyType
+from src.tools._cache import TTLCache
+from src.tools.create_conversation import CreateConversationTool
+from src.tools.send_message import SendMessageTool
+from src.tools.get_conversation_labels import GetConversationLabelsTool, LABELS_MAX_RESPONSE_BYTES
+from src.tools.set_conversation_labels import SetConversationLabelsTool
+from tests.conftest import StubFleepClient
+
+_CREATED_RESPONSE = MappingProxyType({"conversation_id": "conv_123", "topic": "Test Conversation"})
+_SENT_RESPONSE = MappingProxyType({
+    "conversation": {"id": "test-conv-123"},
+    "messages": [{"content": "Hello, World!", "message_nr": 1}]
+})
+_SENT_WITH_ATTACHMENTS_RESPONSE = MappingProxyType({
+    "conversation": {"id": "test-conv-123"},
+    "messages": [{"content": "Check this out!", "message_nr": 1}]
+})
+_RESP_123 = MappingProxyType({"status": "success", "conversation_id": "conv-123"})
+_RESP_456 = MappingProxyType({"status": "success", "conversation_id": "conv-456"})
+_RESP_789 = MappingProxyType({"status": "success", "conversation_id": "conv-789"})
+
+
+@pytest.fixture
+def labels_cache():
+    """Create an empty conversation info cache."""
+    return TTLCache()
+
+
+class TestToolDefinitions:
+    """Test the MCP tool definitions."""
+    
+    @pytest.mark.parametrize("tool_cls,name,required,expected_props", [
+        (
+            CreateConversationTool,
+            "create_conversation",
+            [],  # No required fields in actual implementation
+            frozenset({"member_emails", "topic", "is_invite", "is_autojoin"})
+        ),
+        (
+            SendMessageTool,
+            "send_message",
+            ["conversation_id", "message"],
+            frozenset({"conversation_id", "message", "attachments"})
+        ),
+        (
+            GetConversationLabelsTool,
+            "get_conversation_labels",
+            ["conversation_id"],
+            frozenset({"conversation_id"})
+        ),
+        (
+            SetConversationLabelsTool,
+            "set_conversation_labels",
+            ["conversation_id", "labels"],
+            frozenset({"conversation_id", "labels"})
+        ),
+    ])
+    def test_tool_definition(self, tool_cls, name, required, expected_props):
+        """Test that the tool definition is correctly formatted."""
+        definition = tool_cls.get_tool_definition()
+        
+        assert definition["name"] == name
+        assert "description" in definition
+        assert "inputSchema" in definition
+        
+        schema = definition["inputSchema"]
+        assert schema["type"] == "object"
+        assert schema["required"] == required
+        assert expected_props <= schema["properties"].keys()
+    
+    def test_set_conversation_labels_labels_schema(self):
+        """Test that labels are declared as an array of strings."""
+        definition = SetConversationLabelsTool.get_tool_definition()
+        
+        labels = definition["inputSchema"]["properties"]["labels"]
+        assert labels["type"] == "array"
+        assert labels["items"]["type"] == "string"
+
+
+class TestToolExecuteHappyPath:
+    """Test successful tool execution against the stubbed Fleep client."""
+    
+    @pytest.mark.parametrize("args,expected_kwargs,count", [
+        (
+            {
+                "topic": "Test Conversation",
+                "member_emails": "user1@example.com,user2@example.com",
+                "is_invite": True,
+                "is_autojoin": False
+            },
+            {
+                "topic": "Test Conversation",
+                "member_emails": "user1@example.com,user2@example.com",
+                "is_invite": True,
+                "is_autojoin": False
+            },
+            2,
+        ),
+        (
+            {"member_emails": "user@example.com"},
+            {"topic": None, "member_emails": "user@example.com", "is_invite": True, "is_autojoin": False},
+            1,
+        ),
+        (
+            {"topic": "Test Conversation"},
+            {"topic": "Test Conversation", "member_emails": None, "is_invite": True, "is_autojoin": False},
+            0,
+        ),
+        (
+            {"member_emails": ""},
+            {"topic": None, "member_emails": "", "is_invite": True, "is_autojoin": False},
+            0,
+        ),
+    ], ids=["valid", "minimal", "no_member_emails", "empty_member_emails"])
+    async def test_create_conversation(self, mock_fleep_client, async_return, args, expected_kwargs, count):
+        """Test creating a conversation, with defaults filled in for omitted arguments."""
+        mock_fleep_client.create_conversation = async_return(_CREATED_RESPONSE)
+        
+        result = await CreateConversationTool(mock_fleep_client).execute(args)
+        
+        # Verify the result
+        assert result["success"] is True
+        assert result["conversation"] == _CREATED_RESPONSE
+        assert f"Successfully created conversation with {count} members" in result["message"]
+        if args.get("topic"):
+            assert args["topic"] in result["message"]
+        
+        # Verify the client was called correctly
+        assert mock_fleep_client.create_conversation.calls == [expected_kwargs]
+    
+    @pytest.mark.parametrize("message", ["Hello, World!", ""], ids=["text", "empty"])
+    async def test_send_message(self, mock_fleep_client, async_return, message):
+        """Test successful message sending, including an empty message."""
+        mock_fleep_client.send_message = async_return(_SENT_RESPONSE)
+        
+        arguments = {
+            "conversation_id": "test-conv-123",
+            "message": message
+        }
+        
+        result = await SendMessageTool(mock_fleep_client).execute(arguments)
+        
+        assert result["success"] is True
+        assert "Successfully sent message to conversation test-conv-123" in result["message"]
+        assert result["result"] == _SENT_RESPONSE
+        
+        # Verify the client was called correctly
+        assert mock_fleep_client.send_message.calls == [{
+            "conversation_id": "test-conv-123",
+            "message": message,
+            "attachments": None
+        }]
+    
+    @pytest.mark.parametrize("attachments,fragment", [
+        (["https://example.com/file.jpg"], "with 1 attachment"),
+        (["https://example.com/file1.jpg", "https://example.com/file2.pdf"], "with 2 attachments"),
+    ])
+    async def test_send_message_with_attachments(self, mock_fleep_client, async_return, attachments, fragment):
+        """Test sending message with one or more attachments."""
+        mock_fleep_client.send_message = async_return(_SENT_WITH_ATTACHMENTS_RESPONSE)
+        
+        arguments = {
+            "conversation_id": "test-conv-123",
+            "message": "Check this out!",
+            "attachments": attachments
+        }
+        
+        result = await SendMessageTool(mock_fleep_client).execute(arguments)
+        
+        assert result["success"] is True
+        assert fragment in result["message"]
+        
+        # Verify the client was called correctly
+        assert mock_fleep_client.send_message.calls == [{
+            "conversation_id": "test-conv-123",
+            "message": "Check this out!",
+            "attachments": attachments
+        }]
+    
+    async def test_get_conversation_labels(self, mock_fleep_client, async_return, labels_cache):
+        """Test successful retrieval of conversation labels."""
+        # Mock API response
+        mock_response = {
+            "header": {
+                "conversation_id": "conv-123",
+                "topic": "Project Discussion",
+                "labels": ["urgent", "project-alpha"],
+                "label_ids": ["uuid1", "uuid2"]
+            }
+        }
+        mock_fleep_client.get_conversation_info = async_return(mock_response)
+        
+        # Execute the tool
+        arguments = {"conversation_id": "conv-123"}
+        result = await GetConversationLabelsTool(mock_fleep_client, cache=labels_cache).execute(arguments)
+        
+        # Verify the result
+        assert result["success"] is True
+        assert result["conversation_id"] == "conv-123"
+        assert result["labels"] == ["urgent", "project-alpha"]
+        assert result["label_ids"] == ["uuid1", "uuid2"]
+        assert result["topic"] == "Project Discussion"
+        assert result["label_count"] == 2
+        assert "Found 2 label(s)" in result["message"]
+        
+        # Verify API was called correctly
+        assert mock_fleep_client.get_conversation_info.calls == [{
+            "conversation_id": "conv-123",
+            "detail_level": "ic_header",
+            "max_bytes": LABELS_MAX_RESPONSE_BYTES
+        }]
+    
+    async def test_get_conversation_labels_no_labels(self, mock_fleep_client, async_return, labels_cache):
+        """Test retrieval when conversation has no labels."""
+        # Mock API response with no labels
+        mock_response = {
+            "header": {
+                "conversation_id": "conv-456",
+                "topic": "Empty Discussion",
+                "labels": [],
+                "label_ids": []
+            }
+        }
+        mock_fleep_client.get_conversation_info = async_return(mock_response)
+        
+        # Execute the tool
+        arguments = {"conversation_id": "conv-456"}
+        result = await GetConversationLabelsTool(mock_fleep_client, cache=labels_cache).execute(arguments)
+        
+        # Verify the result
+        assert result["success"] is True
+        assert result["conversation_id"] == "conv-456"
+        assert result["labels"] == []
+        assert result["label_ids"] == []
+        assert result["label_count"] == 0
+        assert result["message"] == "No labels found for this conversation"
+    
+    async def test_get_conversation_labels_uses_cache(self, mock_fleep_client, labels_cache):
+        """Test that repeated lookups are served from the cache."""
+        mock_fleep_client.get_conversation_info.return_value = {
+            "header": {"conversation_id": "conv-123", "labels": ["urgent"], "label_ids": ["uuid1"]}
+        }
+        get_labels_tool = GetConversationLabelsTool(mock_fleep_client, cache=labels_cache)
+        
+        first = await get_labels_tool.execute({"conversation_id": "conv-123"})
+        second = await get_labels_tool.execute({"conversation_id": "conv-123"})
+        
+        assert first == second
+        assert mock_fleep_client.get_conversation_info.call_count == 1
+    
+    @pytest.mark.parametrize("conversation_id,labels,mock_response,expected_fragment", [
+        ("conv-123", ["urgent", "project-alpha", "meeting"], _RESP_123, "Successfully set 3 label(s)"),
+        ("conv-456", [], _RESP_456, "Successfully cleared all labels from the conversation"),
+        ("conv-789", ["important"], _RESP_789, "Successfully set 1 label(s): important"),
+    ])
+    async def test_set_conversation_labels(
+        self, mock_fleep_client, async_return, labels_cache, conversation_id, labels, mock_response, expected_fragment
+    ):
+        """Test setting labels, including clearing them and a single label."""
+        mock_fleep_client.set_conversation_labels = async_return(mock_response)
+        
+        # Execute the tool
+        arguments = {
+            "conversation_id": conversation_id,
+            "labels": labels
+        }
+        result = await SetConversationLabelsTool(mock_fleep_client, cache=labels_cache).execute(arguments)
+        
+        # Verify the result
+        assert result["success"] is True
+        assert result["conversation_id"] == conversation_id
+        assert result["labels_set"] == labels
+        assert result["label_count"] == len(labels)
+        assert expected_fragment in result["message"]
+        assert result["api_response"] == mock_response
+        
+        # Verify API was called correctly
+        assert mock_fleep_client.set_conversation_labels.calls == [{
+            "conversation_id": conversation_id,
+            "labels": labels
+        }]
+    
+    async def test_set_conversation_labels_invalidates_cache(self, mock_fleep_client, labels_cache):
+        """Test that setting labels forces the next lookup to hit the API."""
+        mock_fleep_client.get_conversation_info.return_value = {
+            "header": {"conversation_id": "conv-123", "labels": ["urgent"], "label_ids": ["uuid1"]}
+        }
+        mock_fleep_client.set_conversation_labels.return_value = {"status": "success"}
+        get_labels_tool = GetConversationLabelsTool(mock_fleep_client, cache=labels_cache)
+        set_labels_tool = SetConversationLabelsTool(mock_fleep_client, cache=labels_cache)
+        
+        await get_labels_tool.execute({"conversation_id": "conv-123"})
+        await set_labels_tool.execute({"conversation_id": "conv-123", "labels": ["done"]})
+        await get_labels_tool.execute({"conversation_id": "conv-123"})
+        
+        assert mock_fleep_client.get_conversation_info.call_count == 2
+    
+    async def test_set_conversation_labels_during_pending_lookup(self, mock_fleep_client, labels_cache):
+        """Test that a lookup started before labels were set doesn't cache the old labels."""
+        release = asyncio.Event()
+        responses = iter([["old"], ["new"]])
+        
+        async def get_conversation_info(**kwargs):
+            labels = next(responses)
+            if labels == ["old"]:
+                await release.wait()
+            return {"header": {"conversation_id": "conv-123", "labels": labels, "label_ids": []}}
+        
+        mock_fleep_client.get_conversation_info.side_effect = get_conversation_info
+        mock_fleep_client.set_conversation_labels.return_value = {"status": "success"}
+        get_labels_tool = GetConversationLabelsTool(mock_fleep_client, cache=labels_cache)
+        set_labels_tool = SetConversationLabelsTool(mock_fleep_client, cache=labels_cache)
+        
+        pending = asyncio.create_task(get_labels_tool.execute({"conversation_id": "conv-123"}))
+        await asyncio.sleep(0)
+        await set_labels_tool.execute({"conversation_id": "conv-123", "labels": ["new"]})
+        release.set()
+        await pending
+        
+        result = await get_labels_tool.execute({"conversation_id": "conv-123"})
+        
+        assert result["labels"] == ["new"]
+        assert mock_fleep_client.get_conversation_info.call_count == 2
+    
+    async def test_get_conversation_labels_cache_is_per_account(self, labels_cache):
+        """Test that clients for different accounts don't share cached conversation info."""
+        first_client = StubFleepClient()
+        second_client = StubFleepClient()
+        second_client.email = "other@example.com"
+        for client, label in ((first_client, "mine"), (second_client, "theirs")):
+            client.get_conversation_info.return_value = {
+                "header": {"conversation_id": "conv-123", "labels": [label], "label_ids": []}
+            }
+        
+        first = await GetConversationLabelsTool(first_client, cache=labels_cache).execute({"conversation_id": "conv-123"})
+        second = await GetConversationLabelsTool(second_client, cache=labels_cache).execute({"conversation_id": "conv-123"})
+        
+        assert first["labels"] == ["mine"]
+        assert second["labels"] == ["theirs"]
+
+
+class TestToolExecuteErrors:
+    """Test the error responses shared by all tools."""
+    
+    @pytest.mark.parametrize("tool_cls,args", [
+        # Wrong field types: member_emails should be a string, is_invite a boolean
+        (CreateConversationTool, {"member_emails": 123, "is_invite": "invalid"}),
+        # Missing conversation_id
+        (GetConversationLabelsTool, {}),
+        (SetConversationLabelsTool, {"labels": ["test"]}),
+        (SendMessageTool, {"message": "Hello!"}),
+        # Missing message
+        (SendMessageTool, {"conversation_id": "conv-123"}),
+        # Attachments must be a list of strings
+        (SendMessageTool, {"conversation_id": "conv-123", "message": "Hello!", "attachments": "file.jpg"}),
+        # Missing labels
+        (SetConversationLabelsTool, {"conversation_id": "conv-123"}),
+    ])
+    async def test_execute_with_invalid_arguments(self, tool_cls, args, mock_fleep_client):
+        """Test that invalid arguments are rejected before calling the API."""
+        result = await tool_cls(mock_fleep_client).execute(args)
+        
+        assert result["success"] is False
+        assert result["error"] == "Invalid arguments"
+        assert "details" in result
+        
+        # Client should not be called
+        assert mock_fleep_client.called_methods() == []
+    
+    @pytest.mark.parametrize("tool_cls,method,args,err", [
+        (CreateConversationTool, "create_conversation", {"member_emails": "user@example.com"}, "Failed to create conversation"),
+        (GetConversationLabelsTool, "get_conversation_info", {"conversation_id": "conv-error"}, "Failed to get conversation labels"),
+        (SetConversationLabelsTool, "set_conversation_labels", {"conversation_id": "conv-error", "labels": ["test"]}, "Failed to set conversation labels"),
+        (SendMessageTool, "send_message", {"conversation_id": "conv-error", "message": "Hello, World!"}, "Failed to send message"),
+    ])
+    async def test_execute_with_api_error(self, tool_cls, method, args, err, mock_fleep_client):
+        """Test execution when the API call fails."""
+        getattr(mock_fleep_client, method).side_effect = Exception("API Error")
+        
+        result = await tool_cls(mock_fleep_client).execute(args)
+        
+        assert result["success"] is False
+        assert result["error"] == err
+        assert "API Error" in result["details"]